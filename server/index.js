@@ -7,11 +7,35 @@ const jwt = require('jsonwebtoken');
 const path = require('path');
 require('dotenv').config();
 const crypto = require('crypto');
+const fs = require('fs');
 
-// Auto-generate JWT secret if not provided
+const JWT_SECRET_PATH = path.join(__dirname, 'data/jwt.secret');
+
+// Auto-generate JWT secret if not provided, reusing the one persisted by an earlier start
+// so that a restarted container does not invalidate every issued token
 if (!process.env.JWT_SECRET) {
-    process.env.JWT_SECRET = crypto.randomBytes(64).toString('hex');
-    console.log('Auto-generated JWT_SECRET for this session');
+    try {
+        process.env.JWT_SECRET = fs.readFileSync(JWT_SECRET_PATH, 'utf8').trim();
+    } catch (error) {
+        if (error.code !== 'ENOENT') {
+            console.error('⚠️ Could not read persisted JWT_SECRET:', error.message);
+        }
+    }
+
+    if (process.env.JWT_SECRET) {
+        console.log('Loaded persisted JWT_SECRET');
+    } else {
+        process.env.JWT_SECRET = crypto.randomBytes(64).toString('hex');
+        try {
+            fs.mkdirSync(path.dirname(JWT_SECRET_PATH), { recursive: true });
+            fs.writeFileSync(JWT_SECRET_PATH, process.env.JWT_SECRET, {
+                mode: 0o600 // Read/write for owner only
+            });
+        } catch (error) {
+            console.error('⚠️ Could not persist JWT_SECRET:', error.message);
+        }
+        console.log('Auto-generated JWT_SECRET for this session');
+    }
 }
 
 const authRoutes = require('./routes/auth');
@@ -30,6 +54,10 @@ const app = express();
 
 const PORT = process.env.PORT || 8080;
 
+// Keep idle connections open longer than the Google front end in front of Cloud Run
+// (600s) so it can reuse them instead of racing Node's 5s default and getting resets
+const KEEP_ALIVE_TIMEOUT = 620 * 1000;
+
 // Security middleware
 app.use(helmet({
     contentSecurityPolicy: {
@@ -139,19 +167,20 @@ app.use(async (req, res, next) => {
 });
 
 // Serve static files from client directory
+const STATIC_DIR = path.join(__dirname, '../client');
 app.use((req, res, next) => {
-    const staticPath = path.join(__dirname, '../client');
     const requestedPath = req.path;
-    const fullPath = path.join(staticPath, requestedPath);
     
     // Check if the requested path is for a static file
     if (requestedPath.includes('.') || requestedPath.endsWith('/')) { // Simple check for file extension or directory
+        // Only resolve the full path when it is actually going to be logged
+        const fullPath = path.join(STATIC_DIR, requestedPath);
         console.log(`Static file request: ${requestedPath} -> ${fullPath}`);
     }
     next();
 });
-app.use(express.static(path.join(__dirname, '../client')));
-console.log('Serving static files from:', path.join(__dirname, '../client'));
+app.use(express.static(STATIC_DIR));
+console.log('Serving static files from:', STATIC_DIR);
 
 // Health check endpoint (before auth)
 app.get('/health', (req, res) => {
@@ -194,6 +223,74 @@ app.use((error, req, res, next) => {
     });
 });
 
+// Initialize the backup chain: backup -> scheduler
+async function initializeBackupServices() {
+    // Initialize Backup service
+    console.log('☁️ Initializing BackupService...');
+    try {
+        const backupService = new BackupService(global.jsonStorage);
+        await backupService.initialize();
+        global.backupService = backupService;
+        console.log('✅ BackupService initialized successfully.');
+    } catch (error) {
+        console.error('❌ Failed to initialize BackupService:', error.message);
+        // Don't throw error - backup service can work in local mode
+        console.log('⚠️ BackupService will work in local-only mode');
+    }
+    
+    // Initialize Scheduler service
+    console.log('⏰ Initializing SchedulerService...');
+    try {
+        const schedulerService = new SchedulerService(global.backupService);
+        await schedulerService.initialize();
+        global.schedulerService = schedulerService;
+        console.log('✅ SchedulerService initialized successfully.');
+    } catch (error) {
+        console.error('❌ Failed to initialize SchedulerService:', error.message);
+        // Don't throw error - continue without scheduled backups
+        console.log('⚠️ Scheduled backups will not be available');
+    }
+}
+
+// Initialize user, session and security monitoring services
+async function initializeAccessServices() {
+    // Initialize User Management service
+    console.log('👥 Initializing UserManagementService...');
+    try {
+        const userService = new UserManagementService();
+        await userService.initialize();
+        global.userService = userService;
+        console.log('✅ UserManagementService initialized successfully.');
+    } catch (error) {
+        console.error('❌ Failed to initialize UserManagementService:', error.message);
+        throw error;
+    }
+
+    // Initialize Session Management service
+    console.log('🔐 Initializing SessionManagementService...');
+    try {
+        const sessionService = new SessionManagementService();
+        await sessionService.initialize();
+        global.sessionService = sessionService;
+        console.log('✅ SessionManagementService initialized successfully.');
+    } catch (error) {
+        console.error('❌ Failed to initialize SessionManagementService:', error.message);
+        throw error;
+    }
+
+    // Initialize Security Monitoring service
+    console.log('🛡️ Initializing SecurityMonitoringService...');
+    try {
+        const securityService = new SecurityMonitoringService();
+        await securityService.initialize();
+        global.securityService = securityService;
+        console.log('✅ SecurityMonitoringService initialized successfully.');
+    } catch (error) {
+        console.error('❌ Failed to initialize SecurityMonitoringService:', error.message);
+        throw error;
+    }
+}
+
 // Initialize services and start server
 async function startServer() {
     try {
@@ -231,70 +328,16 @@ async function startServer() {
             throw error;
         }
         
-        // Initialize Backup service
-        console.log('☁️ Initializing BackupService...');
-        try {
-            const backupService = new BackupService(global.jsonStorage);
-            await backupService.initialize();
-            global.backupService = backupService;
-            console.log('✅ BackupService initialized successfully.');
-        } catch (error) {
-            console.error('❌ Failed to initialize BackupService:', error.message);
-            // Don't throw error - backup service can work in local mode
-            console.log('⚠️ BackupService will work in local-only mode');
-        }
-        
-        // Initialize Scheduler service
-        console.log('⏰ Initializing SchedulerService...');
-        try {
-            const schedulerService = new SchedulerService(global.backupService);
-            await schedulerService.initialize();
-            global.schedulerService = schedulerService;
-            console.log('✅ SchedulerService initialized successfully.');
-        } catch (error) {
-            console.error('❌ Failed to initialize SchedulerService:', error.message);
-            // Don't throw error - continue without scheduled backups
-            console.log('⚠️ Scheduled backups will not be available');
-        }
-        
-        // Initialize User Management service
-        console.log('👥 Initializing UserManagementService...');
-        try {
-            const userService = new UserManagementService();
-            await userService.initialize();
-            global.userService = userService;
-            console.log('✅ UserManagementService initialized successfully.');
-        } catch (error) {
-            console.error('❌ Failed to initialize UserManagementService:', error.message);
-            throw error;
-        }
-
-        // Initialize Session Management service
-        console.log('🔐 Initializing SessionManagementService...');
-        try {
-            const sessionService = new SessionManagementService();
-            await sessionService.initialize();
-            global.sessionService = sessionService;
-            console.log('✅ SessionManagementService initialized successfully.');
-        } catch (error) {
-            console.error('❌ Failed to initialize SessionManagementService:', error.message);
-            throw error;
-        }
-
-        // Initialize Security Monitoring service
-        console.log('🛡️ Initializing SecurityMonitoringService...');
-        try {
-            const securityService = new SecurityMonitoringService();
-            await securityService.initialize();
-            global.securityService = securityService;
-            console.log('✅ SecurityMonitoringService initialized successfully.');
-        } catch (error) {
-            console.error('❌ Failed to initialize SecurityMonitoringService:', error.message);
-            throw error;
-        }
+        // The backup chain and the user/session/security services don't depend on each
+        // other, so bring both groups up concurrently (overlaps the Cloud Storage bucket
+        // check with the local file loads)
+        await Promise.all([
+            initializeBackupServices(),
+            initializeAccessServices()
+        ]);
         
         console.log('🌐 Starting HTTP server...');
-        app.listen(PORT, '0.0.0.0', () => {
+        const server = app.listen(PORT, '0.0.0.0', () => {
             console.log('🎉 Sant Padharamani Server started successfully!');
             console.log(`📍 Port: ${PORT}`);
             console.log(`🌍 Environment: ${process.env.NODE_ENV || 'development'}`);
@@ -302,6 +345,7 @@ async function startServer() {
             console.log(`🔐 Login page: http://localhost:${PORT}/auth/login-page`);
             console.log('✅ Server is ready to accept connections');
         });
+        server.keepAliveTimeout = KEEP_ALIVE_TIMEOUT;
     } catch (error) {
         console.error('❌ Failed to start server:', error);
         console.error('🔍 Error details:', {
@@ -314,13 +358,17 @@ async function startServer() {
 }
 
 // Handle graceful shutdown
-process.on('SIGTERM', () => {
+process.on('SIGTERM', async () => {
     console.log('🛑 SIGTERM received, shutting down gracefully');
+    // Persist any debounced session save before exiting
+    await global.sessionService?.flushPendingSave();
     process.exit(0);
 });
 
-process.on('SIGINT', () => {
+process.on('SIGINT', async () => {
     console.log('🛑 SIGINT received, shutting down gracefully');
+    // Persist any debounced session save before exiting
+    await global.sessionService?.flushPendingSave();
     process.exit(0);
 });
 
@@ -1,12 +1,24 @@
 const express = require('express');
 const jwt = require('jsonwebtoken');
 const { getJwtSecret } = require('../middleware/auth');
-const UserManagementService = require('../services/userManagementService');
-const SessionManagementService = require('../services/sessionManagementService');
+
+// Use the global user/session services initialized in server/index.js so that
+// login, logout and requireAuth all share the same in-memory state
+const getUserService = () => {
+    if (!global.userService) {
+        throw new Error('User management service not initialized');
+    }
+    return global.userService;
+};
+
+const getSessionService = () => {
+    if (!global.sessionService) {
+        throw new Error('Session management service not initialized');
+    }
+    return global.sessionService;
+};
 
 const router = express.Router();
-const userService = new UserManagementService();
-const sessionService = new SessionManagementService();
 
 /**
  * POST /auth/login
@@ -20,7 +32,7 @@ router.post('/login', async (req, res) => {
     }
 
     try {
-        const user = await userService.authenticateUser(email, password);
+        const user = await getUserService().authenticateUser(email, password);
 
         const secret = await getJwtSecret();
         
@@ -35,7 +47,7 @@ router.post('/login', async (req, res) => {
         // Create server-side session
         const userAgent = req.get('User-Agent');
         const ipAddress = req.ip || req.connection.remoteAddress;
-        const sessionId = await sessionService.createSession(user.id, user.email, userAgent, ipAddress);
+        const sessionId = await getSessionService().createSession(user.id, user.email, userAgent, ipAddress);
 
         // Track successful login for security monitoring
         if (global.securityService) {
@@ -87,7 +99,7 @@ router.post('/logout', async (req, res) => {
             const decoded = jwt.verify(token, secret);
             
             if (decoded.sessionId) {
-                await sessionService.destroySession(decoded.sessionId);
+                await getSessionService().destroySession(decoded.sessionId);
             }
         } catch (error) {
             console.error('Error during logout:', error.message);
@@ -119,7 +131,7 @@ router.post('/change-password', async (req, res) => {
         const secret = await getJwtSecret();
         const decoded = jwt.verify(token, secret);
         
-        const updatedUser = await userService.changePassword(decoded.email, currentPassword, newPassword);
+        const updatedUser = await getUserService().changePassword(decoded.email, currentPassword, newPassword);
         
         // Track password change for security monitoring
         if (global.securityService) {
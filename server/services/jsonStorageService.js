@@ -1,5 +1,49 @@
 const fs = require('fs').promises;
 const path = require('path');
+const { performance } = require('perf_hooks');
+
+const CACHE_TTL = 60 * 1000; // 1 minute, measured on the monotonic clock
+
+const DATE_KEY_CACHE_LIMIT = 1024;
+const dateKeyCache = new Map(); // stored date value -> YYYYMMDD key (or null)
+
+/**
+ * Parse a stored date into an integer YYYYMMDD key (null if unparseable)
+ */
+const parseDateKey = (value) => {
+    // Fast path for the YYYY-MM-DD values the dashboard stores
+    const match = /^(\d{4})-(\d{2})-(\d{2})/.exec(value);
+    if (match) {
+        return Number(match[1]) * 10000 + Number(match[2]) * 100 + Number(match[3]);
+    }
+
+    const date = new Date(value);
+    if (isNaN(date.getTime())) {
+        return null;
+    }
+    return date.getFullYear() * 10000 + (date.getMonth() + 1) * 100 + date.getDate();
+};
+
+/**
+ * Convert a stored date to an integer YYYYMMDD key so comparisons don't depend on
+ * the string format (returns null for missing or unparseable dates). Keys are
+ * memoized per distinct value, since many records share the same few dates.
+ */
+const toDateKey = (value) => {
+    if (!value) {
+        return null;
+    }
+    if (dateKeyCache.has(value)) {
+        return dateKeyCache.get(value);
+    }
+
+    const key = parseDateKey(value);
+    if (dateKeyCache.size >= DATE_KEY_CACHE_LIMIT) {
+        dateKeyCache.clear();
+    }
+    dateKeyCache.set(value, key);
+    return key;
+};
 
 class JsonStorageService {
     constructor() {
@@ -10,6 +54,9 @@ class JsonStorageService {
             users: path.join(this.dataDir, 'users.json'),
             telegramConfig: path.join(this.dataDir, 'telegram-config.json')
         };
+        this.cache = new Map(); // filePath -> { data, mtimeMs, size, expiresAt }
+        // users.json is also written directly by UserManagementService, so never cache it
+        this.uncachedFiles = new Set([this.files.users]);
         this.initialized = false;
     }
 
@@ -25,15 +72,17 @@ class JsonStorageService {
             console.log('✅ Data directory created/verified:', this.dataDir);
 
             // Initialize all JSON files with empty arrays/objects if they don't exist
-            await this.initializeFile(this.files.padharamaniRequests, []);
-            await this.initializeFile(this.files.assignedPadharamanis, []);
-            await this.initializeFile(this.files.users, []);
-            await this.initializeFile(this.files.telegramConfig, {
-                botToken: '',
-                botUsername: '',
-                webhookUrl: '',
-                allowedUsers: []
-            });
+            await Promise.all([
+                this.initializeFile(this.files.padharamaniRequests, []),
+                this.initializeFile(this.files.assignedPadharamanis, []),
+                this.initializeFile(this.files.users, []),
+                this.initializeFile(this.files.telegramConfig, {
+                    botToken: '',
+                    botUsername: '',
+                    webhookUrl: '',
+                    allowedUsers: []
+                })
+            ]);
 
             this.initialized = true;
             console.log('✅ JsonStorageService initialized successfully');
@@ -59,15 +108,15 @@ class JsonStorageService {
 
     /**
      * Initialize file with default content if it doesn't exist
+     * (exclusive create, so no separate existence check is needed)
      */
     async initializeFile(filePath, defaultContent) {
         try {
-            await fs.access(filePath);
-            console.log(`📄 File already exists: ${path.basename(filePath)}`);
+            await fs.writeFile(filePath, JSON.stringify(defaultContent, null, 2), { flag: 'wx' });
+            console.log(`📄 Created new file: ${path.basename(filePath)}`);
         } catch (error) {
-            if (error.code === 'ENOENT') {
-                await fs.writeFile(filePath, JSON.stringify(defaultContent, null, 2));
-                console.log(`📄 Created new file: ${path.basename(filePath)}`);
+            if (error.code === 'EEXIST') {
+                console.log(`📄 File already exists: ${path.basename(filePath)}`);
             } else {
                 throw error;
             }
@@ -75,12 +124,44 @@ class JsonStorageService {
     }
 
     /**
-     * Read JSON file
+     * Read JSON file (served from the in-memory cache while fresh, and revalidated
+     * against the file's mtime/size once the TTL lapses). Pass `{ bypassCache: true }`
+     * to always read from disk.
+     *
+     * Cached reads return the shared cached object: callers must not mutate it
+     * unless they write it back with writeFile().
      */
-    async readFile(filePath) {
+    async readFile(filePath, { bypassCache = false } = {}) {
+        if (bypassCache || this.uncachedFiles.has(filePath)) {
+            try {
+                return JSON.parse(await fs.readFile(filePath, 'utf8'));
+            } catch (error) {
+                console.error(`❌ Error reading ${path.basename(filePath)}:`, error.message);
+                throw error;
+            }
+        }
+
+        const cached = this.cache.get(filePath);
+        if (cached && cached.expiresAt > performance.now()) {
+            return cached.data;
+        }
+
         try {
-            const data = await fs.readFile(filePath, 'utf8');
-            return JSON.parse(data);
+            // A stat is far cheaper than a full read + parse, so only reload when the file changed
+            const stats = await fs.stat(filePath);
+            if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+                cached.expiresAt = performance.now() + CACHE_TTL;
+                return cached.data;
+            }
+
+            const data = JSON.parse(await fs.readFile(filePath, 'utf8'));
+            this.cache.set(filePath, {
+                data,
+                mtimeMs: stats.mtimeMs,
+                size: stats.size,
+                expiresAt: performance.now() + CACHE_TTL
+            });
+            return data;
         } catch (error) {
             console.error(`❌ Error reading ${path.basename(filePath)}:`, error.message);
             throw error;
@@ -93,8 +174,14 @@ class JsonStorageService {
     async writeFile(filePath, data) {
         try {
             await fs.writeFile(filePath, JSON.stringify(data, null, 2));
+            if (!this.uncachedFiles.has(filePath)) {
+                // No mtime recorded, so the first revalidation after the TTL reloads from disk
+                this.cache.set(filePath, { data, expiresAt: performance.now() + CACHE_TTL });
+            }
             console.log(`💾 Saved data to ${path.basename(filePath)}`);
         } catch (error) {
+            // Callers mutate the cached object before writing, so drop it on failure
+            this.cache.delete(filePath);
             console.error(`❌ Error writing ${path.basename(filePath)}:`, error.message);
             throw error;
         }
@@ -172,7 +259,7 @@ class JsonStorageService {
     }
 
     /**
-     * Get all padharamani requests
+     * Get all padharamani requests (the shared cached array - do not mutate)
      */
     async getScheduledPadharamanis() {
         try {
@@ -189,10 +276,14 @@ class JsonStorageService {
     async getUpcomingPadharamanis() {
         try {
             const assigned = await this.readFile(this.files.assignedPadharamanis);
-            const today = new Date().toISOString().split('T')[0];
+            const todayString = new Date().toISOString().split('T')[0];
+            const today = toDateKey(todayString);
             
             return assigned.filter(item => {
-                return item.date >= today && item.status !== 'Canceled';
+                // Unparseable or missing dates keep the original string comparison
+                const dateKey = toDateKey(item.date);
+                const onOrAfterToday = dateKey !== null ? dateKey >= today : item.date >= todayString;
+                return onOrAfterToday && item.status !== 'Canceled';
             });
         } catch (error) {
             console.error('❌ Error getting upcoming padharamanis:', error);
@@ -206,10 +297,14 @@ class JsonStorageService {
     async getArchivedPadharamanis() {
         try {
             const assigned = await this.readFile(this.files.assignedPadharamanis);
-            const today = new Date().toISOString().split('T')[0];
+            const todayString = new Date().toISOString().split('T')[0];
+            const today = toDateKey(todayString);
             
             return assigned.filter(item => {
-                return item.date < today || item.status === 'Canceled';
+                // Unparseable or missing dates keep the original string comparison
+                const dateKey = toDateKey(item.date);
+                const beforeToday = dateKey !== null ? dateKey < today : item.date < todayString;
+                return beforeToday || item.status === 'Canceled';
             });
         } catch (error) {
             console.error('❌ Error getting archived padharamanis:', error);
@@ -384,10 +479,15 @@ class JsonStorageService {
      */
     async getAllData() {
         try {
-            const data = {};
-            for (const [key, filePath] of Object.entries(this.files)) {
-                data[key] = await this.readFile(filePath);
-            }
+            // Read every data file from disk (backups must never see a stale cached
+            // snapshot) in one concurrent batch instead of one after another
+            const entries = await Promise.all(
+                Object.entries(this.files).map(async ([key, filePath]) => [
+                    key,
+                    await this.readFile(filePath, { bypassCache: true })
+                ])
+            );
+            const data = Object.fromEntries(entries);
             data.backupTimestamp = new Date().toISOString();
             return data;
         } catch (error) {
@@ -5,12 +5,23 @@ class SchedulerService {
         this.backupService = backupService;
         this.jobs = [];
         this.initialized = false;
+        this.initPromise = null;
     }
 
     /**
      * Initialize scheduler service
      */
-    async initialize() {
+    initialize() {
+        // Reuse the first (possibly still running) call so cron jobs are scheduled once
+        // (cleared on failure so a failed initialization can be retried)
+        this.initPromise ??= this.runInitialize().catch(error => {
+            this.initPromise = null;
+            throw error;
+        });
+        return this.initPromise;
+    }
+
+    async runInitialize() {
         console.log('⏰ SchedulerService initialization started...');
         
         try {
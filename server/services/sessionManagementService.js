@@ -4,15 +4,28 @@ const crypto = require('crypto');
 
 const SESSIONS_FILE_PATH = path.join(__dirname, '../data/sessions.json');
 const SESSION_TIMEOUT = 60 * 60 * 1000; // 1 hour
+const SAVE_DEBOUNCE = 5 * 1000; // 5 seconds
 
 class SessionManagementService {
     constructor() {
         this.initialized = false;
+        this.initPromise = null;
         this.sessions = new Map();
         this.cleanupInterval = null;
+        this.saveTimer = null;
     }
 
-    async initialize() {
+    initialize() {
+        // Reuse the in-flight promise so a second call cannot start another cleanup interval
+        // (cleared on failure so a failed initialization can be retried)
+        this.initPromise ??= this.runInitialize().catch(error => {
+            this.initPromise = null;
+            throw error;
+        });
+        return this.initPromise;
+    }
+
+    async runInitialize() {
         try {
             // Ensure data directory exists
             const dataDir = path.dirname(SESSIONS_FILE_PATH);
@@ -56,6 +69,12 @@ class SessionManagementService {
     }
 
     async saveSessions() {
+        // A full save covers any pending debounced save
+        if (this.saveTimer) {
+            clearTimeout(this.saveTimer);
+            this.saveTimer = null;
+        }
+
         try {
             // Convert Map to array for JSON serialization
             const sessionsArray = Array.from(this.sessions.values());
@@ -65,6 +84,24 @@ class SessionManagementService {
         }
     }
 
+    // Coalesce bursts of session touches into a single write
+    scheduleSave() {
+        if (this.saveTimer) {
+            return;
+        }
+        this.saveTimer = setTimeout(async () => {
+            this.saveTimer = null;
+            await this.saveSessions();
+        }, SAVE_DEBOUNCE);
+    }
+
+    // Write out any debounced save right away (e.g. before the process exits)
+    async flushPendingSave() {
+        if (this.saveTimer) {
+            await this.saveSessions();
+        }
+    }
+
     generateSessionId() {
         return crypto.randomBytes(32).toString('hex');
     }
@@ -106,7 +143,7 @@ class SessionManagementService {
         // Update last accessed time and extend expiration
         session.lastAccessedAt = now;
         session.expiresAt = now + SESSION_TIMEOUT;
-        await this.saveSessions();
+        this.scheduleSave();
 
         return session;
     }
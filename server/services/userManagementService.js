@@ -10,6 +10,9 @@ class UserManagementService {
     constructor() {
         this.initialized = false;
         this.users = [];
+        // O(1) lookup indexes over this.users, rebuilt by indexUsers()
+        this.usersByEmail = new Map();
+        this.usersByTelegramId = new Map();
     }
 
     async initialize() {
@@ -46,6 +49,31 @@ class UserManagementService {
                 throw error;
             }
         }
+        this.indexUsers();
+    }
+
+    indexUsers() {
+        this.usersByEmail = new Map();
+        this.usersByTelegramId = new Map();
+        for (const user of this.users) {
+            this.indexUser(user);
+        }
+    }
+
+    // Keep the first user per key, matching the find()/findIndex() lookups the
+    // indexes replace (e.g. a Telegram user can share a password user's email)
+    indexUser(user) {
+        if (!this.usersByEmail.has(user.email)) {
+            this.usersByEmail.set(user.email, user);
+        }
+        if (user.telegramId !== undefined && !this.usersByTelegramId.has(user.telegramId)) {
+            this.usersByTelegramId.set(user.telegramId, user);
+        }
+    }
+
+    storeUser(user) {
+        this.users.push(user);
+        this.indexUser(user);
     }
 
     async saveUsers() {
@@ -66,7 +94,7 @@ class UserManagementService {
             createdAt: new Date().toISOString()
         };
 
-        this.users.push(defaultAdmin);
+        this.storeUser(defaultAdmin);
         await this.saveUsers();
         
         console.log('🔐 Default admin user created:');
@@ -77,8 +105,7 @@ class UserManagementService {
 
     async ensureDefaultAdmin() {
         // Check if admin user exists in memory
-        const adminExists = this.users.some(u => u.email === 'admin@santpadharamani.com');
-        if (!adminExists) {
+        if (!this.usersByEmail.has('admin@santpadharamani.com')) {
             console.log('⚠️ Admin user not found in memory, recreating...');
             await this.createDefaultAdmin();
         }
@@ -105,8 +132,7 @@ class UserManagementService {
 
     async createUser(email, password, name, isAdmin = false) {
         // Check if user already exists
-        const existingUser = this.users.find(u => u.email === email);
-        if (existingUser) {
+        if (this.usersByEmail.has(email)) {
             throw new Error('User already exists');
         }
 
@@ -127,7 +153,7 @@ class UserManagementService {
             createdAt: new Date().toISOString()
         };
 
-        this.users.push(newUser);
+        this.storeUser(newUser);
         await this.saveUsers();
 
         // Return user without password
@@ -139,15 +165,13 @@ class UserManagementService {
         // Always ensure admin user exists (Cloud Run ephemeral storage fix)
         await this.ensureDefaultAdmin();
         
-        const userIndex = this.users.findIndex(u => u.email === email);
-        if (userIndex === -1) {
+        const user = this.usersByEmail.get(email);
+        if (!user) {
             // Log failed attempt for non-existent user
             console.log(`🚨 Authentication attempt for non-existent user: ${email}`);
             throw new Error('Invalid credentials');
         }
 
-        const user = this.users[userIndex];
-
         // Check if account is locked
         if (user.accountLockedUntil && new Date() < new Date(user.accountLockedUntil)) {
             const unlockTime = new Date(user.accountLockedUntil).toLocaleString();
@@ -204,16 +228,16 @@ class UserManagementService {
     }
 
     async approveUser(email) {
-        const userIndex = this.users.findIndex(u => u.email === email);
-        if (userIndex === -1) {
+        const user = this.usersByEmail.get(email);
+        if (!user) {
             throw new Error('User not found');
         }
 
-        this.users[userIndex].isApproved = true;
-        this.users[userIndex].approvedAt = new Date().toISOString();
+        user.isApproved = true;
+        user.approvedAt = new Date().toISOString();
         await this.saveUsers();
 
-        const { password: _, ...userWithoutPassword } = this.users[userIndex];
+        const { password: _, ...userWithoutPassword } = user;
         return userWithoutPassword;
     }
 
@@ -225,27 +249,29 @@ class UserManagementService {
     }
 
     async deleteUser(email) {
-        const userIndex = this.users.findIndex(u => u.email === email);
-        if (userIndex === -1) {
+        const user = this.usersByEmail.get(email);
+        if (!user) {
             throw new Error('User not found');
         }
 
         // Prevent deleting the last admin
         const adminUsers = this.users.filter(u => u.isAdmin && u.isApproved);
-        if (adminUsers.length === 1 && this.users[userIndex].isAdmin) {
+        if (adminUsers.length === 1 && user.isAdmin) {
             throw new Error('Cannot delete the last admin user');
         }
 
-        this.users.splice(userIndex, 1);
+        this.users.splice(this.users.indexOf(user), 1);
+        this.indexUsers();
         await this.saveUsers();
         return { success: true, message: 'User deleted successfully' };
     }
 
     async updateUser(email, updates) {
-        const userIndex = this.users.findIndex(u => u.email === email);
-        if (userIndex === -1) {
+        const user = this.usersByEmail.get(email);
+        if (!user) {
             throw new Error('User not found');
         }
+        const userIndex = this.users.indexOf(user);
 
         // Hash password if provided
         if (updates.password) {
@@ -253,7 +279,8 @@ class UserManagementService {
         }
 
         // Update user
-        this.users[userIndex] = { ...this.users[userIndex], ...updates, updatedAt: new Date().toISOString() };
+        this.users[userIndex] = { ...user, ...updates, updatedAt: new Date().toISOString() };
+        this.indexUsers();
         await this.saveUsers();
 
         const { password: _, ...userWithoutPassword } = this.users[userIndex];
@@ -261,13 +288,11 @@ class UserManagementService {
     }
 
     async changePassword(email, currentPassword, newPassword) {
-        const userIndex = this.users.findIndex(u => u.email === email);
-        if (userIndex === -1) {
+        const user = this.usersByEmail.get(email);
+        if (!user) {
             throw new Error('User not found');
         }
 
-        const user = this.users[userIndex];
-
         // If user must change password, skip current password check
         if (!user.mustChangePassword) {
             const isValidCurrentPassword = await bcrypt.compare(currentPassword, user.password);
@@ -299,7 +324,7 @@ class UserManagementService {
             `user_${telegramData.id}@telegram.local`;
 
         // Check if Telegram user already exists
-        const existingUser = this.users.find(u => u.telegramId === telegramData.id);
+        const existingUser = this.usersByTelegramId.get(telegramData.id);
         if (existingUser) {
             return existingUser;
         }
@@ -315,7 +340,7 @@ class UserManagementService {
             createdAt: new Date().toISOString()
         };
 
-        this.users.push(telegramUser);
+        this.storeUser(telegramUser);
         await this.saveUsers();
 
         return telegramUser;